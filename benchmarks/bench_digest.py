@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк сборки дайджестов на сотне тысяч пользователей одного времени отправки.
+
+В базе SQLite во временном каталоге создаются пользователи с одним
+``next_digest_at`` (08:00 по Москве), у каждого — идеи и задачи за
+последние двое суток с темами, и столько же пользователей с другим временем
+дайджеста (они не должны влиять на сборку). Затем измеряются:
+- сборка всех дайджестов времени отправки заранее (``DigestBuilder.prepare``);
+- выдача готовых текстов пачкой при отправке (``DigestBuilder.take``);
+- для сравнения — сборка по одному пользователю запросами репозиториев
+  (статистика, элементы за сутки, streak) на выборке, с пересчетом на всех.
+
+Запуск:
+    python benchmarks/bench_digest.py [--users 100000] [--ideas 5] [--tasks 3] [--batch 500]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from src.core.database import IdeaRepository, UserSettingsRepository
+from src.core.models import Base, Idea, ItemCluster, Task, UserSettings
+from src.core.task_repository import TaskRepository
+from src.services.digest_builder import DigestBuilder, storage_time
+
+BUCKET = datetime(2024, 3, 1, 5, 0)
+WORDS = ["купить", "позвонить", "написать", "отчет", "презентацию", "молоко", "маме", "книгу", "план", "сайт"]
+LABELS = ["Работа", "Дом", "Покупки", "Семья", "Учеба"]
+
+
+def populate(session_factory, users: int, ideas: int, tasks: int):
+    created = storage_time(BUCKET)
+    with session_factory() as session:
+        session.execute(insert(UserSettings), [
+            {"user_id": user_id, "digest_time": "08:00", "timezone": "Europe/Moscow",
+             "next_digest_at": BUCKET if user_id <= users else BUCKET + timedelta(hours=1 + user_id % 12),
+             "streak_count": user_id % 30}
+            for user_id in range(1, 2 * users + 1)
+        ])
+        session.execute(insert(ItemCluster), [
+            {"id": user_id * 10 + index, "user_id": user_id, "model": "bench", "label": label, "size": 1,
+             "centroid": b"\0"}
+            for user_id in range(1, 2 * users + 1) for index, label in enumerate(LABELS[:3])
+        ])
+        for model, count in ((Idea, ideas), (Task, tasks)):
+            session.execute(insert(model), [
+                {"user_id": user_id, "content": " ".join(random.sample(WORDS, 3)),
+                 "created_at": created - timedelta(minutes=random.randint(1, 48 * 60)),
+                 "is_done": random.random() < 0.3, "cluster_id": random.choice((None, user_id * 10, user_id * 10 + 1))}
+                for user_id in range(1, 2 * users + 1) for _ in range(count)
+            ])
+        session.commit()
+
+
+def per_user(session_factory, user_id: int):
+    """Сборка дайджеста одного пользователя запросами репозиториев (как до сборки заранее)."""
+    with session_factory() as db:
+        since = storage_time(BUCKET) - timedelta(days=1)
+        db.query(Idea).filter(Idea.user_id == user_id, Idea.created_at >= since).all()
+        db.query(Task).filter(Task.user_id == user_id, Task.created_at >= since).all()
+        IdeaRepository(db).get_user_stats(user_id)
+        TaskRepository(db).get_user_stats(user_id)
+        UserSettingsRepository(db).get_or_create_user_settings(user_id)
+        db.query(ItemCluster.id, ItemCluster.label).filter(ItemCluster.user_id == user_id).all()
+
+
+def run(users: int, ideas: int, tasks: int, batch: int, sample: int):
+    random.seed(42)
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{os.path.join(directory, 'bench.db')}")
+        Base.metadata.create_all(engine)
+        session_factory = sessionmaker(bind=engine)
+        started = time.perf_counter()
+        populate(session_factory, users, ideas, tasks)
+        print(f"\n📄 {users:,} пользователей с дайджестом в 08:00 и {users:,} с другим временем, "
+              f"{ideas} идей и {tasks} задач у каждого (заполнение {time.perf_counter() - started:.1f} с)")
+
+        builder = DigestBuilder(session_factory, lead=300)
+        started = time.perf_counter()
+        built = builder.prepare(BUCKET - timedelta(minutes=5))
+        elapsed = time.perf_counter() - started
+        print(f"⏱  Сборка заранее:       {elapsed:8.2f} с на {built:,} дайджестов "
+              f"({elapsed / built * 1e6:.1f} мкс на пользователя)")
+
+        ids = list(range(1, users + 1))
+        latencies = []
+        for start in range(0, len(ids), batch):
+            started = time.perf_counter()
+            payloads = builder.take(ids[start:start + batch], now=BUCKET)
+            latencies.append(time.perf_counter() - started)
+            assert len(payloads) == len(ids[start:start + batch])
+        print(f"⏱  Выдача пачки {batch}:     p50 {np.percentile(latencies, 50) * 1000:8.2f} мс, "
+              f"всего {sum(latencies):.2f} с")
+
+        sampled = random.sample(ids, min(sample, users))
+        started = time.perf_counter()
+        for user_id in sampled:
+            per_user(session_factory, user_id)
+        elapsed = (time.perf_counter() - started) / len(sampled)
+        print(f"⏱  По одному:            {elapsed * 1000:8.2f} мс на пользователя, "
+              f"≈ {elapsed * users:.1f} с на {users:,} (выборка {len(sampled):,})")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, nargs="+", default=[100000])
+    parser.add_argument("--ideas", type=int, default=5, help="Идей у пользователя")
+    parser.add_argument("--tasks", type=int, default=3, help="Задач у пользователя")
+    parser.add_argument("--batch", type=int, default=500, help="Пользователей в пачке отправки")
+    parser.add_argument("--sample", type=int, default=2000, help="Пользователей для сборки по одному")
+    args = parser.parse_args()
+
+    for size in args.users:
+        run(size, args.ideas, args.tasks, args.batch, args.sample)
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк векторного индекса: поиск похожих элементов на 10^5 и 10^6 векторах.
+
+Для каждого размера во временном каталоге создается шард со случайными
+векторами единичной длины, затем измеряются:
+- запись шарда и его открытие (чтение идентификаторов);
+- дописывание одного элемента без перестроения;
+- задержка top-k по memmap-матрице (p50/p95) и проверка результата
+  полным перебором.
+
+Запуск:
+    python benchmarks/bench_embeddings.py [--sizes 100000 1000000] [--dim 256] [--queries 50]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.embedding_index import EmbeddingShard
+
+CHUNK = 100000
+
+
+def random_vectors(rng, count: int, dim: int) -> np.ndarray:
+    vectors = rng.standard_normal((count, dim), dtype=np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors
+
+
+def percentile(samples, q):
+    return float(np.percentile(samples, q)) * 1000
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100000, 1000000])
+    parser.add_argument("--dim", type=int, default=256)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--queries", type=int, default=50)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as directory:
+            print(f"\n📐 {size:,} векторов × {args.dim} (float32, {size * args.dim * 4 / 2**20:.0f} МБ)")
+
+            shard = EmbeddingShard(directory, 1, "bench", args.dim)
+            started = time.perf_counter()
+            for start in range(0, size, CHUNK):
+                count = min(CHUNK, size - start)
+                shard.append([(('idea', start + i), 0) for i in range(count)], random_vectors(rng, count, args.dim))
+            print(f"⏱  Запись шарда:               {time.perf_counter() - started:8.2f} с")
+
+            started = time.perf_counter()
+            shard = EmbeddingShard(directory, 1, "bench", args.dim)
+            print(f"⏱  Открытие шарда:             {time.perf_counter() - started:8.2f} с")
+
+            vector = random_vectors(rng, 1, args.dim)
+            started = time.perf_counter()
+            shard.append([(('idea', size), 0)], vector)
+            print(f"⏱  Дописывание элемента:       {(time.perf_counter() - started) * 1000:8.2f} мс")
+
+            queries = random_vectors(rng, args.queries, args.dim)
+            shard.top_k(queries[0], args.k)  # прогрев: страницы файла в кэше ОС
+            latencies = []
+            for query in queries:
+                started = time.perf_counter()
+                result = shard.top_k(query, args.k)
+                latencies.append(time.perf_counter() - started)
+            print(f"⏱  Top-{args.k}: p50 {percentile(latencies, 50):8.2f} мс, p95 {percentile(latencies, 95):8.2f} мс")
+
+            expected = np.argsort(-(np.asarray(shard.matrix()) @ queries[-1]))[:args.k]
+            assert [item.item_id for item in result] == [int(i) for i in expected]
+            print("✅ Результат совпадает с полным перебором")
+            del shard
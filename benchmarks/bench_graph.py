@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк графа связей на пользователе с десятками тысяч элементов.
+
+В базе SQLite во временном каталоге создаются заметки одного пользователя
+(синтетические тексты с тегами) и таблица ребер со случайными связями
+(``--degree`` ребер на элемент, как после длительной работы бота). Затем
+измеряются:
+- загрузка графа из таблицы ребер (первое обращение к пользователю);
+- пересчет ребер одного элемента при сохранении (шард векторов открыт);
+- запрос соседей (p50/p95), в том числе элемента без ребер, который
+  связывается при запросе;
+- окрестность в два шага для тем вокруг элемента.
+
+Запуск:
+    python benchmarks/bench_graph.py [--items 20000 50000] [--degree 10] [--queries 1000]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import sessionmaker
+
+from src.core.embedding_index import EmbeddingIndexManager
+from src.core.embeddings import HashingEmbedder
+from src.core.graph import GraphManager, RELATED, SIMILAR, TAG, encode_node
+from src.core.models import Base, Idea, ItemEdge
+
+VERBS = ["купить", "позвонить", "написать", "подготовить", "придумать", "заказать", "починить", "прочитать"]
+OBJECTS = ["молоко", "маме", "отчет", "презентацию", "приложение", "билеты", "кран", "книгу", "статью",
+           "подарок", "план", "сайт", "велосипед", "договор", "рецепт", "маршрут"]
+TAGS = ["работа", "дом", "покупки", "семья", "учеба", "здоровье", "финансы", "хобби", "поездка", "идея"]
+
+
+def percentile(samples, q):
+    return float(np.percentile(samples, q)) * 1000
+
+
+def make_manager(session_factory, directory):
+    def loader(user_id):
+        with session_factory() as session:
+            for item_id, content in session.execute(select(Idea.id, Idea.content).where(Idea.user_id == user_id)):
+                yield 'idea', item_id, content
+
+    return GraphManager(EmbeddingIndexManager(loader, HashingEmbedder(256), directory), session_factory)
+
+
+def measure(call, ids):
+    latencies = []
+    for item_id in ids:
+        started = time.perf_counter()
+        call(item_id)
+        latencies.append(time.perf_counter() - started)
+    return f"p50 {percentile(latencies, 50):8.3f} мс, p95 {percentile(latencies, 95):8.3f} мс"
+
+
+def run(items: int, degree: int, queries: int):
+    random.seed(42)
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{os.path.join(directory, 'bench.db')}")
+        Base.metadata.create_all(engine)
+        session_factory = sessionmaker(bind=engine)
+        edges = {}
+        # Первые 90% элементов связаны, остальные — как сохраненные до появления графа
+        linked = int(items * 0.9)
+        for item_id in range(1, linked + 1):
+            for _ in range(degree // 2):
+                other = random.randint(1, linked)
+                if other != item_id:
+                    source, target = sorted((encode_node('idea', item_id), encode_node('idea', other)))
+                    edges[(source, target)] = random.choice((SIMILAR, SIMILAR, TAG, RELATED))
+        with session_factory() as session:
+            session.execute(insert(Idea), [
+                {
+                    "user_id": 1,
+                    "content": f"{random.choice(VERBS)} {random.choice(OBJECTS)} {random.choice(OBJECTS)} {i}",
+                    "tags": json.dumps(random.sample(TAGS, 2), ensure_ascii=False),
+                }
+                for i in range(items)
+            ])
+            session.execute(insert(ItemEdge), [
+                {"user_id": 1, "source": source, "target": target, "relation": relation, "weight": random.random()}
+                for (source, target), relation in edges.items()
+            ])
+            session.commit()
+        print(f"\n📄 {items:,} заметок одного пользователя, {len(edges):,} ребер")
+
+        manager = make_manager(session_factory, directory)
+        started = time.perf_counter()
+        manager.get_graph(1)
+        print(f"⏱  Загрузка графа из таблицы ребер: {time.perf_counter() - started:8.2f} с")
+        started = time.perf_counter()
+        manager.embeddings.get_shard(1)
+        print(f"⏱  Открытие шарда векторов:         {time.perf_counter() - started:8.2f} с")
+
+        with session_factory() as session:
+            item = Idea(user_id=1, content="купить подарок маме", tags=json.dumps(["семья", "покупки"]))
+            session.add(item)
+            session.commit()
+            item = SimpleNamespace(id=item.id, content=item.content, tags=item.tags)
+        started = time.perf_counter()
+        manager.update_item(1, 'idea', item)
+        print(f"⏱  Пересчет ребер при сохранении:   {(time.perf_counter() - started) * 1000:8.2f} мс")
+
+        print(f"⏱  Соседи:                 {measure(lambda i: manager.neighbors(1, 'idea', i), [random.randint(1, linked) for _ in range(queries)])}")
+        print(f"⏱  Соседи элемента без ребер: {measure(lambda i: manager.neighbors(1, 'idea', i), random.sample(range(linked + 1, items + 1), min(100, items - linked)))}")
+        print(f"⏱  Окрестность (2 шага):   {measure(lambda i: manager.neighborhood(1, 'idea', i), [random.randint(1, linked) for _ in range(100)])}")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, nargs="+", default=[20000, 50000])
+    parser.add_argument("--degree", type=int, default=10, help="Среднее число ребер на элемент")
+    parser.add_argument("--queries", type=int, default=1000)
+    args = parser.parse_args()
+
+    for size in args.items:
+        run(size, args.degree, args.queries)
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк локального классификатора перед LLM.
+
+Заметки с категориями от LLM делятся на обучающую и проверочную части.
+На проверочной части измеряются доля заметок, категоризованных локально
+(столько запросов к LLM не понадобится), совпадение локальных ответов с
+ответами LLM и время на заметку — отдельно для правил и для модели.
+
+Источник заметок — база бота (категории с ``category_source`` от LLM) или,
+без ``--database``, синтетический корпус.
+
+Запуск:
+    python benchmarks/bench_preclassifier.py [--database sqlite:///ideas.db] [--notes 5000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from collections import Counter
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from src.core.models import Idea, Task
+from src.services.pre_classifier import LOCAL_SOURCES, PreClassifier
+
+# Категория «LLM» → шаблоны заметок; у части категорий нет правил
+TEMPLATES = {
+    "Покупки": ["купить {}", "заказать {} домой", "зайти в магазин за {}"],
+    "Звонки": ["позвонить {}", "перезвонить {} вечером"],
+    "Здоровье": ["записаться к врачу {}", "купить таблетки от {}", "тренировка {}"],
+    "Финансы": ["оплатить {}", "заплатить за {} до пятницы"],
+    "Работа": ["подготовить отчет по {}", "совещание по {}", "презентация для {}"],
+    "Идеи": ["идея для стартапа: {}", "придумать сервис для {}", "бизнес-идея {}"],
+    "Путешествия": ["забронировать отель в {}", "билеты в {} на лето", "маршрут по {}"],
+    "Творчество": ["написать рассказ про {}", "нарисовать {}", "сочинить песню про {}"],
+}
+WORDS = ["маму", "молоко", "проект", "клиента", "квартиру", "отпуск", "Казань", "горы", "кота",
+         "интернет", "зубы", "спину", "соседей", "квартал", "друзей", "Питер", "море", "осень"]
+
+
+def synthetic_notes(count: int):
+    """Синтетические заметки с категориями «от LLM»."""
+    random.seed(42)
+    categories = list(TEMPLATES)
+    notes = []
+    for _ in range(count):
+        category = random.choice(categories)
+        notes.append((random.choice(TEMPLATES[category]).format(random.choice(WORDS)), category))
+    return notes
+
+
+def database_notes(url: str):
+    """Заметки из базы с категориями, которые дал LLM."""
+    session = sessionmaker(bind=create_engine(url))()
+    notes = []
+    for model in (Idea, Task):
+        notes.extend(session.execute(
+            select(model.content, model.category)
+            .where(model.category.isnot(None), model.category_source.isnot(None),
+                   model.category_source.notin_(LOCAL_SOURCES))
+        ).all())
+    session.close()
+    return [(content, category) for content, category in notes]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--database", help="URL базы с категоризованными заметками")
+    parser.add_argument("--notes", type=int, default=5000, help="Размер синтетического корпуса")
+    parser.add_argument("--holdout", type=float, default=0.2, help="Доля проверочных заметок")
+    parser.add_argument("--min-probability", type=float, default=0.9)
+    args = parser.parse_args()
+
+    notes = database_notes(args.database) if args.database else synthetic_notes(args.notes)
+    random.seed(7)
+    random.shuffle(notes)
+    split = int(len(notes) * (1 - args.holdout))
+    train, test = notes[:split], notes[split:]
+    print(f"📄 Заметок: {len(notes)} (обучение {len(train)}, проверка {len(test)})")
+
+    classifier = PreClassifier(min_probability=args.min_probability, min_samples=1)
+    started = time.perf_counter()
+    classifier.train(train)
+    print(f"🧠 Обучение: {(time.perf_counter() - started) * 1000:.1f} мс, "
+          f"категорий {len(classifier.model.categories)}")
+
+    tiers = Counter()
+    correct = Counter()
+    started = time.perf_counter()
+    results = [classifier.classify(content) for content, _ in test]
+    elapsed = time.perf_counter() - started
+    for (_, label), result in zip(test, results):
+        tier = result.backend if result else "llm"
+        tiers[tier] += 1
+        if result and result.category.casefold() == label.casefold():
+            correct[tier] += 1
+
+    local = tiers["rules"] + tiers["bayes"]
+    print(f"⏱  {elapsed / len(test) * 1e6:.1f} мкс/заметку")
+    for tier in ("rules", "bayes"):
+        if tiers[tier]:
+            print(f"   {tier:<6} {tiers[tier] / len(test):6.1%} заметок, совпадение с LLM {correct[tier] / tiers[tier]:6.1%}")
+    print(f"✅ Запросов к LLM не понадобилось: {local / len(test):.1%}")
+    if local:
+        print(f"🎯 Совпадение локальных ответов с LLM: {(correct['rules'] + correct['bayes']) / local:.1%}")
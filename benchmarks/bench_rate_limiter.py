@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк rate limiter на миллионе различных пользователей.
+
+Запуск:
+    python benchmarks/bench_rate_limiter.py [--users 1000000] [--backend memory|sqlite]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.validation import RateLimiter, MemoryRateLimitBackend, SQLiteRateLimitBackend
+
+
+def run(users: int, backend_name: str):
+    """Прогон is_allowed по `users` различным пользователям и очистка."""
+    if backend_name == "sqlite":
+        path = os.path.join(tempfile.mkdtemp(), "rate_limits.db")
+        backend = SQLiteRateLimitBackend(path)
+    else:
+        backend = MemoryRateLimitBackend()
+
+    limiter = RateLimiter(max_requests=15, time_window=60, backend=backend, cleanup_interval=10**9)
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    for user_id in range(1, users + 1):
+        limiter.is_allowed(user_id, 'save')
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"📊 Backend: {backend_name}, пользователей: {users}")
+    print(f"⏱  is_allowed: {elapsed:.2f} с, {users / elapsed:,.0f} запросов/с, "
+          f"{elapsed / users * 1e6:.2f} мкс/запрос")
+    print(f"💾 Пиковая память: {peak / 1024 / 1024:.1f} МБ ({peak / users:.0f} байт/пользователь)")
+    print(f"📦 Состояний в хранилище: {len(backend)}")
+
+    # Через окно все лимиты восстанавливаются, состояния можно удалить
+    started = time.perf_counter()
+    evicted = limiter.cleanup(time.time() + 61)
+    print(f"🧹 Очистка: удалено {evicted} состояний за {time.perf_counter() - started:.2f} с, "
+          f"осталось {len(backend)}")
+    assert evicted == users and len(backend) == 0, "очистка должна удалить все истекшие состояния"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=1_000_000)
+    parser.add_argument("--backend", choices=["memory", "sqlite"], default="memory")
+    args = parser.parse_args()
+    run(args.users, args.backend)
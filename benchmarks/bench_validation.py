@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк валидации и очистки сообщения максимальной длины (4000 символов).
+
+Сравнивает прежнюю схему (re.search на каждый паттерн, `in` на каждое
+спам-слово, два прохода re.sub) со скомпилированным однопроходным фильтром
+на стандартном и большом словаре.
+
+Запуск:
+    python benchmarks/bench_validation.py [--words 10000] [--repeat 200]
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.validation import ContentFilter, SecurityValidator
+
+
+def legacy_validate_and_sanitize(content, forbidden_patterns, spam_words):
+    """Прежняя схема: отдельный проход на каждый паттерн и слово."""
+    for pattern in forbidden_patterns:
+        if re.search(pattern, content, re.IGNORECASE):
+            return None
+    content_lower = content.lower()
+    spam_count = sum(1 for word in spam_words if word in content_lower)
+    if spam_count > SecurityValidator.SPAM_THRESHOLD:
+        return None
+    content = re.sub(r'<[^>]+>', '', content)
+    return re.sub(r'\s+', ' ', content).strip()
+
+
+def make_message(length: int = SecurityValidator.MAX_MESSAGE_LENGTH) -> str:
+    """Обычный текст с тегами и лишними пробелами, без спама."""
+    words = ["идея", "проект", "сделать", "завтра", "<b>важно</b>", "встреча", "  ", "\n", "код"]
+    random.seed(42)
+    parts = []
+    while sum(len(p) + 1 for p in parts) < length:
+        parts.append(random.choice(words))
+    return " ".join(parts)[:length]
+
+
+def make_spam_words(count: int):
+    """Синтетический словарь спам-слов."""
+    random.seed(7)
+    alphabet = "абвгдежзиклмнопрстуфхцчшщэюя"
+    return SecurityValidator.SPAM_WORDS + [
+        "".join(random.choice(alphabet) for _ in range(random.randint(5, 12))) for _ in range(count)
+    ]
+
+
+def measure(label, func, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    elapsed = (time.perf_counter() - started) / repeat
+    print(f"⏱  {label:<40} {elapsed * 1000:8.3f} мс/сообщение")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--words", type=int, default=10000, help="Размер большого словаря")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    message = make_message()
+    forbidden = SecurityValidator.FORBIDDEN_PATTERNS
+    print(f"📄 Сообщение: {len(message)} символов")
+
+    for spam_words in (SecurityValidator.SPAM_WORDS, make_spam_words(args.words)):
+        content_filter = ContentFilter(forbidden, spam_words)
+        assert content_filter.scan(message).sanitized == legacy_validate_and_sanitize(message, forbidden, spam_words)
+        print(f"\n📚 Словарь: {len(spam_words)} спам-слов")
+        measure("Прежняя схема", lambda: legacy_validate_and_sanitize(message, forbidden, spam_words), args.repeat)
+        measure("Однопроходный фильтр", lambda: content_filter.scan(message), args.repeat)
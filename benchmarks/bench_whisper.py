@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк задержки и пропускной способности распознавания Whisper.
+
+Прогоняет корпус аудиофайлов через WhisperService с заданным числом
+воркеров: все клипы отправляются одновременно, как при пике нагрузки.
+Клипы заранее декодируются в PCM, как в боте. Каждый размер пакета из
+--batch-sizes прогоняется отдельно, 1 — декодирование по одному клипу.
+
+Запуск:
+    python benchmarks/bench_whisper.py <папка с клипами> [--workers 2] [--model base] [--batch-sizes 1 8]
+"""
+
+import argparse
+import asyncio
+import glob
+import os
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.services.whisper_service import WhisperService, SAMPLE_RATE
+
+AUDIO_EXTENSIONS = ("*.ogg", "*.oga", "*.opus", "*.mp3", "*.wav", "*.m4a")
+
+
+def load_clip(path: str):
+    """PCM 16 кГц mono float32, как после AudioService.decode_to_pcm."""
+    import whisper
+    return whisper.load_audio(path)
+
+
+async def run(service: WhisperService, clips):
+    latencies = []
+
+    async def one(audio):
+        started = time.perf_counter()
+        await service.transcribe(audio)
+        latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(audio) for audio in clips))
+    return time.perf_counter() - started, latencies
+
+
+def bench(args, clips, audio_seconds: float, batch_size: int) -> float:
+    """Прогон корпуса с заданным размером пакета, возвращает клипов в секунду."""
+    service = WhisperService(model_name=args.model, workers=args.workers, batch_size=batch_size)
+    started = time.perf_counter()
+    service.start()
+    print(f"\n📦 Размер пакета {batch_size}")
+    print(f"🔥 Прогрев {args.workers} воркеров: {time.perf_counter() - started:.1f} с")
+
+    try:
+        wall, latencies = asyncio.run(run(service, clips))
+    finally:
+        service.shutdown()
+
+    latencies.sort()
+    print(f"⏱  Задержка p50: {statistics.median(latencies):.2f} с, "
+          f"p95: {latencies[int(len(latencies) * 0.95) - 1]:.2f} с, max: {latencies[-1]:.2f} с")
+    print(f"🚀 Пропускная способность: {len(clips) / wall:.2f} клипов/с, "
+          f"{audio_seconds / wall:.1f} с аудио за секунду (RTF {wall / audio_seconds:.3f})")
+    return len(clips) / wall
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("corpus", help="Папка с аудиоклипами")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--model", default=None)
+    parser.add_argument("--repeat", type=int, default=1, help="Повторить корпус N раз")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 8],
+                        help="Размеры пакета для сравнения (1 — по одному клипу)")
+    args = parser.parse_args()
+
+    paths = sorted(p for ext in AUDIO_EXTENSIONS for p in glob.glob(os.path.join(args.corpus, ext)))
+    if not paths:
+        sys.exit(f"В {args.corpus} нет аудиофайлов")
+    clips = [load_clip(path) for path in paths] * args.repeat
+    audio_seconds = sum(len(audio) for audio in clips) / SAMPLE_RATE
+    print(f"🎙 Клипов: {len(clips)}, аудио: {audio_seconds:.1f} с")
+
+    throughput = {batch_size: bench(args, clips, audio_seconds, batch_size) for batch_size in args.batch_sizes}
+
+    baseline = throughput.get(1)
+    if baseline:
+        print()
+        for batch_size, value in throughput.items():
+            print(f"📊 Пакет {batch_size}: {value:.2f} клипов/с ({value / baseline:.2f}x к декодированию по одному)")
@@ -16,6 +16,30 @@ class Settings(BaseSettings):
     # AI Services
     openai_api_key: Optional[str] = Field(None, env="OPENAI_API_KEY")
     ollama_base_url: str = Field("http://localhost:11434", env="OLLAMA_BASE_URL")
+    ollama_model: str = Field("llama3.1", env="OLLAMA_MODEL")
+    ollama_concurrency: int = Field(2, env="OLLAMA_CONCURRENCY")  # одновременных запросов
+    openai_model: str = Field("gpt-4o-mini", env="OPENAI_MODEL")
+    openai_base_url: str = Field("https://api.openai.com/v1", env="OPENAI_BASE_URL")
+    openai_concurrency: int = Field(8, env="OPENAI_CONCURRENCY")
+    llm_timeout: float = Field(30.0, env="LLM_TIMEOUT")  # секунды
+    llm_connect_timeout: float = Field(5.0, env="LLM_CONNECT_TIMEOUT")
+    llm_max_connections: int = Field(20, env="LLM_MAX_CONNECTIONS")
+    llm_retries: int = Field(2, env="LLM_RETRIES")
+    llm_retry_backoff: float = Field(0.5, env="LLM_RETRY_BACKOFF")  # секунды
+    llm_breaker_threshold: int = Field(5, env="LLM_BREAKER_THRESHOLD")  # ошибок подряд
+    llm_breaker_reset: float = Field(60.0, env="LLM_BREAKER_RESET")  # секунды
+    llm_cache_max_entries: int = Field(10000, env="LLM_CACHE_MAX_ENTRIES")
+    enrichment_interval: float = Field(10.0, env="ENRICHMENT_INTERVAL")  # секунды
+    enrichment_batch_size: int = Field(50, env="ENRICHMENT_BATCH_SIZE")  # записей за раз
+    enrichment_prompt_batch: int = Field(10, env="ENRICHMENT_PROMPT_BATCH")  # заметок в промпте
+    llm_prompt_token_budget: int = Field(3000, env="LLM_PROMPT_TOKEN_BUDGET")  # токенов на запрос
+    llm_max_note_tokens: int = Field(256, env="LLM_MAX_NOTE_TOKENS")  # длиннее — обрезается
+    enrichment_lease: float = Field(300.0, env="ENRICHMENT_LEASE")  # секунды
+    preclassifier_enabled: bool = Field(True, env="PRECLASSIFIER_ENABLED")
+    preclassifier_min_probability: float = Field(0.9, env="PRECLASSIFIER_MIN_PROBABILITY")
+    preclassifier_min_samples: int = Field(200, env="PRECLASSIFIER_MIN_SAMPLES")  # заметок с категорией от LLM
+    preclassifier_retrain_interval: float = Field(3600.0, env="PRECLASSIFIER_RETRAIN_INTERVAL")  # секунды
+    preclassifier_training_limit: int = Field(20000, env="PRECLASSIFIER_TRAINING_LIMIT")  # последних заметок каждого типа
     
     # Database
     database_url: str = Field("sqlite:///ideas.db", env="DATABASE_URL")
@@ -27,6 +51,77 @@ class Settings(BaseSettings):
     # Scheduler
     digest_time: str = Field("08:00", env="DIGEST_TIME")
     timezone: str = Field("Europe/Moscow", env="TIMEZONE")
+    digest_batch_size: int = Field(500, env="DIGEST_BATCH_SIZE")  # пользователей в пачке отправки
+    digest_catch_up: float = Field(3600.0, env="DIGEST_CATCH_UP")  # секунды; опоздавшие сильнее пропускаются
+    digest_precompute_lead: float = Field(300.0, env="DIGEST_PRECOMPUTE_LEAD")  # секунды до отправки
+    
+    # Voice / Whisper
+    whisper_model: str = Field("base", env="WHISPER_MODEL")
+    whisper_workers: int = Field(1, env="WHISPER_WORKERS")
+    whisper_device: str = Field("cpu", env="WHISPER_DEVICE")
+    whisper_batch_size: int = Field(8, env="WHISPER_BATCH_SIZE")  # клипов до 30 с в пакете
+    whisper_batch_wait: float = Field(0.05, env="WHISPER_BATCH_WAIT")  # секунды
+    whisper_tiers: str = Field("", env="WHISPER_TIERS")  # например "tiny,base,small"
+    whisper_latency_slo: float = Field(15.0, env="WHISPER_LATENCY_SLO")  # секунды
+    whisper_idle_upgrade: bool = Field(True, env="WHISPER_IDLE_UPGRADE")
+    whisper_upgrade_backlog: int = Field(20, env="WHISPER_UPGRADE_BACKLOG")
+    ffmpeg_binary: str = Field("ffmpeg", env="FFMPEG_BINARY")
+    media_cache_dir: str = Field("temp_audio", env="MEDIA_CACHE_DIR")
+    media_cache_max_bytes: int = Field(512 * 1024 * 1024, env="MEDIA_CACHE_MAX_BYTES")  # байты
+    media_cache_ttl: int = Field(24 * 3600, env="MEDIA_CACHE_TTL")  # секунды
+    max_voice_duration: int = Field(600, env="MAX_VOICE_DURATION")  # секунды
+    max_voice_size: int = Field(20 * 1024 * 1024, env="MAX_VOICE_SIZE")  # байты
+    vad_enabled: bool = Field(True, env="VAD_ENABLED")
+    vad_max_pause: float = Field(0.6, env="VAD_MAX_PAUSE")  # секунды
+    chunk_min_duration: float = Field(45.0, env="CHUNK_MIN_DURATION")  # секунды
+    chunk_seconds: float = Field(25.0, env="CHUNK_SECONDS")
+    chunk_overlap: float = Field(1.0, env="CHUNK_OVERLAP")
+    stream_edit_interval: float = Field(1.5, env="STREAM_EDIT_INTERVAL")  # секунды между правками
+    language_learn_samples: int = Field(3, env="LANGUAGE_LEARN_SAMPLES")  # определений подряд
+    language_min_probability: float = Field(0.8, env="LANGUAGE_MIN_PROBABILITY")
+    language_min_logprob: float = Field(-1.0, env="LANGUAGE_MIN_LOGPROB")
+    transcription_queue_size: int = Field(20, env="TRANSCRIPTION_QUEUE_SIZE")
+    transcription_queue_per_user: int = Field(3, env="TRANSCRIPTION_QUEUE_PER_USER")
+    transcript_cache_path: str = Field("data/transcripts.db", env="TRANSCRIPT_CACHE_PATH")
+    transcript_cache_size: int = Field(10000, env="TRANSCRIPT_CACHE_SIZE")  # записей
+    
+    # Metrics
+    metrics_file: str = Field("data/metrics.prom", env="METRICS_FILE")
+    metrics_interval: int = Field(60, env="METRICS_INTERVAL")  # секунды
+    
+    # Rate limiting (запросов в минуту по классам действий)
+    rate_limit_save: int = Field(15, env="RATE_LIMIT_SAVE")
+    rate_limit_read: int = Field(120, env="RATE_LIMIT_READ")
+    rate_limit_callback: int = Field(60, env="RATE_LIMIT_CALLBACK")
+    rate_limit_backend: str = Field("memory", env="RATE_LIMIT_BACKEND")  # memory | sqlite
+    rate_limit_db_path: str = Field("data/rate_limits.db", env="RATE_LIMIT_DB_PATH")
+    
+    # Content validation (дополнительные словари, одна запись на строку)
+    spam_words_file: Optional[str] = Field(None, env="SPAM_WORDS_FILE")
+    forbidden_patterns_file: Optional[str] = Field(None, env="FORBIDDEN_PATTERNS_FILE")
+    
+    # Near-duplicate detection (порог сходства Жаккара)
+    duplicate_threshold: float = Field(0.7, env="DUPLICATE_THRESHOLD")
+    
+    # Inline search
+    inline_cache_time: int = Field(10, env="INLINE_CACHE_TIME")
+    search_index_max_users: int = Field(1000, env="SEARCH_INDEX_MAX_USERS")
+    
+    # Semantic search (эмбеддинги)
+    embedding_provider: str = Field("hashing", env="EMBEDDING_PROVIDER")  # hashing | sentence-transformers
+    embedding_model: str = Field("sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2", env="EMBEDDING_MODEL")
+    embedding_dim: int = Field(256, env="EMBEDDING_DIM")  # размерность хеширующего векторизатора
+    embedding_dir: str = Field("data/embeddings", env="EMBEDDING_DIR")
+    embedding_max_users: int = Field(100, env="EMBEDDING_MAX_USERS")  # открытых шардов
+    similar_limit: int = Field(5, env="SIMILAR_LIMIT")
+    cluster_threshold: float = Field(0.35, env="CLUSTER_THRESHOLD")  # сходство с центроидом для назначения в тему
+    cluster_max: int = Field(12, env="CLUSTER_MAX")  # тем на пользователя
+    cluster_refine_every: int = Field(50, env="CLUSTER_REFINE_EVERY")  # назначений между шагами mini-batch k-means
+    cluster_refine_batch: int = Field(256, env="CLUSTER_REFINE_BATCH")
+    graph_similarity_threshold: float = Field(0.5, env="GRAPH_SIMILARITY_THRESHOLD")  # сходство для ребра «похожи»
+    graph_similar_limit: int = Field(5, env="GRAPH_SIMILAR_LIMIT")  # ребер «похожи» от элемента
+    graph_tag_limit: int = Field(5, env="GRAPH_TAG_LIMIT")  # последних элементов с тем же тегом
+    graph_neighbors_limit: int = Field(10, env="GRAPH_NEIGHBORS_LIMIT")  # соседей в /graph
     
     class Config:
         env_file = ".env"
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Пакетный поиск и объединение почти-дубликатов идей и задач.
+
+Заполняет колонку minhash у старых записей и находит группы похожих
+элементов каждого пользователя. По умолчанию только показывает группы;
+с флагом --apply в каждой группе остается самый старый элемент (его ID
+и дата создания) с формулировкой самого нового, остальные удаляются.
+Запущенный бот убирает удаленные элементы из индексов в памяти, когда
+встречает их (``BotHandlers.forget_item``), или при перестроении индекса.
+
+Запуск:
+    python dedupe_database.py [--apply] [--threshold 0.7]
+"""
+
+import argparse
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from src.core.models import create_tables, SessionLocal, Idea, Task
+from src.core.similarity import compute_signature, find_duplicate_groups
+from src.utils.logger import logger
+from config.settings import settings
+
+def fill_signatures(session, model) -> int:
+    """Вычисление minhash для записей, созданных до появления колонки."""
+    filled = 0
+    for item in session.query(model).filter(model.minhash.is_(None)).yield_per(1000):
+        item.minhash = compute_signature(item.content)
+        filled += 1
+    session.commit()
+    return filled
+
+def dedupe_model(session, model, label: str, threshold: float, apply: bool) -> int:
+    """Поиск и (опционально) объединение дубликатов одной таблицы."""
+    removed = 0
+    user_ids = [row[0] for row in session.query(model.user_id).distinct()]
+    
+    for user_id in user_ids:
+        items = session.query(model).filter(model.user_id == user_id).order_by(model.created_at, model.id).all()
+        by_id = {item.id: item for item in items}
+        groups = find_duplicate_groups(((item.id, item.minhash) for item in items), threshold)
+        
+        for group in groups:
+            keep, newest = by_id[group[0]], by_id[group[-1]]
+            logger.info(f"Пользователь {user_id}: {label} {group} — дубликаты, остается ID {keep.id}")
+            for item_id in group:
+                logger.info(f"  ID {item_id}: '{by_id[item_id].content[:50]}'")
+            
+            if apply:
+                keep.content = newest.content
+                keep.minhash = newest.minhash
+                keep.is_done = any(by_id[item_id].is_done for item_id in group)
+                for item_id in group[1:]:
+                    session.delete(by_id[item_id])
+                    removed += 1
+        
+        if apply:
+            session.commit()
+    
+    return removed
+
+def dedupe_database(threshold: float, apply: bool):
+    """Пакетная дедупликация идей и задач всех пользователей."""
+    create_tables()
+    session = SessionLocal()
+    try:
+        for model, label in ((Idea, "идеи"), (Task, "задачи")):
+            filled = fill_signatures(session, model)
+            logger.info(f"Заполнено сигнатур ({label}): {filled}")
+            removed = dedupe_model(session, model, label, threshold, apply)
+            if apply:
+                logger.info(f"Удалено дубликатов ({label}): {removed}")
+        
+        if not apply:
+            logger.info("Пробный запуск: изменения не применены (используйте --apply)")
+    except Exception as e:
+        session.rollback()
+        logger.error(f"Ошибка дедупликации: {e}")
+        raise
+    finally:
+        session.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Поиск и объединение почти-дубликатов")
+    parser.add_argument("--apply", action="store_true", help="Объединить найденные дубликаты")
+    parser.add_argument("--threshold", type=float, default=settings.duplicate_threshold)
+    args = parser.parse_args()
+    dedupe_database(args.threshold, args.apply)